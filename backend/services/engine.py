@@ -1,27 +1,65 @@
 from backend.services.historical import load_real_returns
+import numpy as np
 import pandas as pd
 
+_MIN_NORMAL = np.finfo(np.float64).tiny
+
+
+def _simulate_path_loop(
+    growth: np.ndarray, initial_balance: float, withdrawal: float
+) -> np.ndarray:
+    balance = initial_balance
+    balances = np.empty(len(growth), dtype=np.float64)
+
+    for i, g in enumerate(growth.tolist()):
+        # Apply returns, then withdraw
+        balance = balance * g - withdrawal
+        balances[i] = balance
+
+    return balances
+
+
+def _simulate_path(
+    growth: np.ndarray, initial_balance: float, withdrawal: float
+) -> np.ndarray:
+    with np.errstate(over="ignore", under="ignore"):
+        cumulative = np.cumprod(growth)
+    # The closed form divides by the running product, so it needs every value
+    # finite and a normal positive float: a total loss (g <= 0), or a long run
+    # of losses underflowing to zero, means stepping through instead
+    if not (np.isfinite(cumulative) & (cumulative >= _MIN_NORMAL)).all():
+        return _simulate_path_loop(growth, initial_balance, withdrawal)
+
+    if withdrawal == 0:
+        # Nothing leaves the portfolio, so the path is pure compounding
+        return initial_balance * cumulative
+
+    # Unrolling b[t] = b[t-1] * g[t] - w gives
+    # b[t] = G[t] * (b[0] - w * sum(1 / G[:t+1])) with G the running product
+    with np.errstate(over="ignore", invalid="ignore"):
+        balances = cumulative * (
+            initial_balance - withdrawal * np.cumsum(1.0 / cumulative)
+        )
+    if not np.isfinite(balances).all():
+        return _simulate_path_loop(growth, initial_balance, withdrawal)
+    return balances
+
 
 def evaluate_strategy(
     returns: pd.DataFrame,
     initial_balance: float = 1_000_000,
     withdrawal: float = 40_000,
 ) -> dict:
-    balance = initial_balance
-    balances = []
-
-    for _, row in returns.iterrows():
-        # Apply returns
-        balance *= 1 + row["real_sp500"]
-        # Withdraw
-        balance -= withdrawal
-        balances.append(balance)
+    # Build the monthly growth factors once as float64
+    growth = 1.0 + returns["real_sp500"].to_numpy(dtype=np.float64)
+    balances = _simulate_path(growth, initial_balance, withdrawal)
+    balance = float(balances[-1]) if len(balances) else initial_balance
 
     success = bool(balance > 0)
     return {
         "final_balance": round(balance, 2),
         "success": success,
-        "path": balances,
+        "path": balances.tolist(),
         "success_rate": 100.0 if success else 0.0,
     }
 
@@ -1,30 +1,67 @@
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 
 DATA_DIR = Path("data/processed")
 
 
-def load_spx_ohlcv(filename: str = "SPX.csv") -> pd.DataFrame:
-    path = DATA_DIR / filename
-    df = pd.read_csv(path, parse_dates=["Date"])
+@lru_cache(maxsize=8)
+def _read_dated_csv(
+    path: Path, mtime: float, usecols: tuple[str, ...] | None
+) -> pd.DataFrame:
+    # mtime is part of the cache key so an updated file is re-read
+    df = pd.read_csv(
+        path,
+        usecols=list(usecols) if usecols else None,
+        parse_dates=["Date"],
+        date_format="%Y-%m-%d",
+    )
+    if not pd.api.types.is_datetime64_any_dtype(df["Date"]):
+        # pandas leaves dates that don't match the hint as strings; parse
+        # them with format inference instead (raises if they aren't dates)
+        df["Date"] = pd.to_datetime(df["Date"])
     df.set_index("Date", inplace=True)
-    df = df.sort_index()
+    # The shipped files are already chronological; only pay for a sort if not
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    return df
+
+
+def _load_dated_csv(
+    filename: str, usecols: tuple[str, ...] | None = None
+) -> pd.DataFrame:
+    path = (DATA_DIR / filename).resolve()
+    # Callers rename and add columns, so never hand out the cached frame
+    return _read_dated_csv(path, path.stat().st_mtime, usecols).copy()
+
+
+def load_spx_ohlcv(filename: str = "SPX.csv") -> pd.DataFrame:
+    # Only the adjusted close is used; skip parsing the other OHLCV columns
+    df = _load_dated_csv(filename, usecols=("Date", "Adj Close"))
     df = df[["Adj Close"]].rename(columns={"Adj Close": "sp500"})
     return df
 
 
 def load_market_data(filename: str = "market.csv") -> pd.DataFrame:
-    path = DATA_DIR / filename
-    df = pd.read_csv(path, parse_dates=["Date"])
-    df.set_index("Date", inplace=True)
-    df = df.sort_index()
+    df = _load_dated_csv(filename)
     df.columns = ["sp500", "bonds", "cpi"]
     return df
 
 
+def _pct_change(df: pd.DataFrame) -> pd.DataFrame:
+    # Matches df.pct_change(fill_method=None): a missing month is not
+    # forward-filled, so it yields NaN returns on both sides for dropna().
+    # Zero prices give inf/NaN like pandas does, without a RuntimeWarning.
+    values = df.to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = values[1:] / values[:-1] - 1.0
+    return pd.DataFrame(returns, index=df.index[1:], columns=df.columns)
+
+
 def compute_monthly_returns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
-    monthly = df[columns].resample("M").last()
-    returns = monthly.pct_change().dropna()
+    monthly = df[columns].resample("ME").last()
+    returns = _pct_change(monthly).dropna()
     return returns
 
 
@@ -37,5 +74,5 @@ def adjust_for_inflation(df: pd.DataFrame) -> pd.DataFrame:
 def load_real_returns() -> pd.DataFrame:
     df = load_market_data()
     df = adjust_for_inflation(df)
-    real = df[["real_sp500", "real_bonds"]].resample("ME").last().pct_change().dropna()
+    real = _pct_change(df[["real_sp500", "real_bonds"]].resample("ME").last()).dropna()
     return real
@@ -1,4 +1,14 @@
-from backend.services.engine import run_backtest
+import pandas as pd
+import pytest
+from backend.services.engine import evaluate_strategy, run_backtest
+
+
+def _monthly_path(returns, balance, withdrawal):
+    path = []
+    for r in returns:
+        balance = balance * (1 + r) - withdrawal
+        path.append(balance)
+    return path
 
 
 def test_run_backtest():
@@ -7,3 +17,33 @@ def test_run_backtest():
     assert "success" in result
     assert isinstance(result["path"], list)
     assert len(result["path"]) > 0
+
+
+def test_evaluate_strategy_matches_monthly_recurrence():
+    returns = [0.01, -0.02, 0.03, 0.05, -0.04]
+    result = evaluate_strategy(pd.DataFrame({"real_sp500": returns}))
+    expected = _monthly_path(returns, 1_000_000, 40_000)
+    assert result["path"] == pytest.approx(expected)
+    assert result["final_balance"] == pytest.approx(expected[-1], abs=0.01)
+
+
+def test_evaluate_strategy_total_loss_month():
+    returns = [0.01, -1.0, 0.05]
+    result = evaluate_strategy(pd.DataFrame({"real_sp500": returns}))
+    assert result["path"] == pytest.approx(_monthly_path(returns, 1_000_000, 40_000))
+    assert not result["success"]
+
+
+def test_evaluate_strategy_cumulative_underflow():
+    returns = [-0.9] * 400
+    result = evaluate_strategy(pd.DataFrame({"real_sp500": returns}))
+    expected = _monthly_path(returns, 1_000_000, 40_000)
+    assert result["path"] == pytest.approx(expected)
+    assert result["final_balance"] == pytest.approx(-44_444.44, abs=0.01)
+
+
+def test_evaluate_strategy_without_withdrawal():
+    returns = [0.01, -0.02, 0.03]
+    result = evaluate_strategy(pd.DataFrame({"real_sp500": returns}), withdrawal=0)
+    assert result["path"] == pytest.approx(_monthly_path(returns, 1_000_000, 0))
+    assert result["success"]
@@ -1,3 +1,8 @@
+import os
+import warnings
+import numpy as np
+import pandas as pd
+import pytest
 from backend.services import historical
 
 
@@ -16,3 +21,43 @@ def test_real_returns():
     df = historical.load_real_returns()
     assert {"real_sp500", "real_bonds"}.issubset(df.columns)
     assert df.isna().sum().sum() == 0
+
+
+def test_load_market_data_raises_if_file_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        historical.load_market_data(str(tmp_path / "missing.csv"))
+
+
+def test_load_market_data_cache_copies_and_rereads(tmp_path):
+    path = tmp_path / "market.csv"
+    path.write_text("Date,sp500,bonds,cpi\n1962-01-02,70.0,4.0,30.0\n")
+
+    df = historical.adjust_for_inflation(historical.load_market_data(str(path)))
+    df.loc[:, "sp500"] = 0.0
+    again = historical.load_market_data(str(path))
+    assert list(again.columns) == ["sp500", "bonds", "cpi"]
+    assert again["sp500"].iloc[0] == 70.0
+
+    path.write_text("Date,sp500,bonds,cpi\n1962-01-02,80.0,4.0,30.0\n")
+    mtime = path.stat().st_mtime + 10
+    os.utime(path, (mtime, mtime))
+    assert historical.load_market_data(str(path))["sp500"].iloc[0] == 80.0
+
+
+def test_monthly_returns_do_not_fill_missing_months():
+    index = pd.date_range("2000-01-31", periods=5, freq="ME")
+    df = pd.DataFrame({"sp500": [1.0, np.nan, 1.21, 0.0, 2.0]}, index=index)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        returns = historical.compute_monthly_returns(df, ["sp500"])
+    assert list(returns["sp500"]) == [-1.0, np.inf]
+
+
+def test_load_market_data_parses_other_date_formats(tmp_path):
+    path = tmp_path / "market.csv"
+    path.write_text(
+        "Date,sp500,bonds,cpi\n01/02/1962,70.0,4.0,30.0\n02/01/1962,71.0,4.1,30.1\n"
+    )
+    df = historical.load_market_data(str(path))
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert df.index[0] == pd.Timestamp("1962-01-02")
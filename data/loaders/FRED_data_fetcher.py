@@ -1,6 +1,8 @@
+import pandas as pd
 import pandas_datareader.data as web
 from datetime import datetime
 import os
+import sys
 
 # Set date range (from FRED's earliest coverage)
 start = datetime(1927, 1, 1)
@@ -12,20 +14,32 @@ raw_data_dir = os.path.join(
 )
 os.makedirs(raw_data_dir, exist_ok=True)
 
+# Pass --refresh to re-download series even if they were fetched today
+force_refresh = "--refresh" in sys.argv
+
+
+def fetch_series(series: str, filename: str) -> pd.DataFrame:
+    path = os.path.join(raw_data_dir, filename)
+    if os.path.exists(path) and not force_refresh:
+        # A file written today already covers the requested range up to `end`;
+        # anything older is re-downloaded so runs always get current data
+        downloaded = datetime.fromtimestamp(os.path.getmtime(path)).date()
+        if downloaded >= end.date():
+            return pd.read_csv(path, index_col=0, parse_dates=True)
+    df = web.DataReader(series, "fred", start, end)
+    df.to_csv(path)
+    return df
+
+
 # S&P 500 Index (FRED series: 'SP500')
-sp500 = web.DataReader("SP500", "fred", start, end)
+sp500 = fetch_series("SP500", "sp500.csv")
 
 # US 10-Year Treasury Constant Maturity (FRED series: 'DGS10')
-ust10y = web.DataReader("DGS10", "fred", start, end)
+ust10y = fetch_series("DGS10", "us10y.csv")
 
 # Consumer Price Index for All Urban Consumers: All Items (FRED series: 'CPIAUCSL')
-cpi = web.DataReader("CPIAUCSL", "fred", start, end)
-
-# Save to CSV
-sp500.to_csv(os.path.join(raw_data_dir, "sp500.csv"))
-ust10y.to_csv(os.path.join(raw_data_dir, "us10y.csv"))
-cpi.to_csv(os.path.join(raw_data_dir, "cpi_fred.csv"))
+cpi = fetch_series("CPIAUCSL", "cpi_fred.csv")
 
-print("Data downloaded. S&P500 rows:", len(sp500))
+print("Data ready. S&P500 rows:", len(sp500))
 print("US 10Y Treasury rows:", len(ust10y))
 print("CPI rows:", len(cpi))